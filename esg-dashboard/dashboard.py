@@ -1,8 +1,7 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import numpy as np
+from datetime import date
 
 # -----------------------------------------------------------------------------
 # 1. Page Config & Premium CSS Styling
@@ -10,11 +9,15 @@ import numpy as np
 st.set_page_config(
     page_title="ESG Performance Dashboard",
     layout="wide",
-    initial_sidebar_state="expanded"
+    initial_sidebar_state="expanded",
+    menu_items={"About": "ESG Performance Dashboard - Data Source: Enterprise ESG Hub"}
 )
 
+
 # Custom CSS for a spacious, high-end look
-st.markdown("""
+@st.cache_resource
+def _css():
+    return """
 <style>
     /* Global Background: Very light grey for contrast with white cards */
     .stApp {
@@ -58,29 +61,267 @@ st.markdown("""
     }
 
     /* Chart Containers: subtle borders */
-    .stPlotlyChart {
+    .stPlotlyChart, .ring-card {
         background-color: #FFFFFF;
         border-radius: 12px;
         padding: 10px;
         box-shadow: 0 1px 3px rgba(0,0,0,0.05);
     }
+
+    /* KPI Ring: pure-CSS doughnut for single-value compliance metrics */
+    .ring-card {
+        height: 320px; /* 300px figure + 10px padding, like .stPlotlyChart */
+        box-sizing: border-box;
+    }
+    .ring-title {
+        color: #111827;
+        font-size: 17px;
+        font-weight: 700;
+        padding: 8px 0 0 8px;
+    }
+    .ring {
+        position: relative;
+        width: 180px;
+        height: 180px;
+        margin: 30px auto 0;
+        border-radius: 50%;
+        /* --pct, --ring-fill and --ring-rest are set inline from the palette constants */
+        background: conic-gradient(var(--ring-fill) calc(var(--pct) * 1%), var(--ring-rest) 0);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    }
+    .ring::before {
+        content: "";
+        position: absolute;
+        inset: 27px; /* 70% hole */
+        border-radius: 50%;
+        background-color: #FFFFFF;
+    }
+    .ring span {
+        position: relative;
+        color: var(--ring-fill);
+        font-size: 24px;
+        font-weight: 700;
+        text-align: center;
+    }
+    .ring small {
+        display: block;
+        color: #6B7280;
+        font-size: 12px;
+        font-weight: 500;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+st.markdown(_css(), unsafe_allow_html=True)
+
 
 # -----------------------------------------------------------------------------
 # 2. Sidebar Controls
 # -----------------------------------------------------------------------------
+@st.cache_data(ttl=3600)
+def _last_update():
+    return date.today().isoformat()
+
+
 st.sidebar.header("Dashboard Controls")
 selected_year = st.sidebar.selectbox("Fiscal Year", [2025, 2024, 2023])
 selected_scope = st.sidebar.selectbox("Scope", ["Global", "North America", "EMEA", "APAC"])
 st.sidebar.markdown("---")
-st.sidebar.caption(f"Data Source: Enterprise ESG Hub\nLast Update: {pd.Timestamp.now().strftime('%Y-%m-%d')}")
+st.sidebar.caption(f"Data Source: Enterprise ESG Hub\nLast Update: {_last_update()}")
 
 # Color Palette (Professional/Corporate)
 COLOR_PRIMARY = "#0F766E"  # Teal
 COLOR_SECONDARY = "#0EA5E9"  # Sky Blue
 COLOR_ACCENT = "#F59E0B"  # Amber
 COLOR_GREY = "#9CA3AF"
+COLOR_NEGATIVE = "#EF4444"  # Red
+
+# Derived Colors
+RGBA_PRIMARY_10 = "rgba(15, 118, 110, 0.1)"  # Teal area fill
+
+# High-end Sankey Colors (Muted/Professional)
+SANKEY_NODE_COLORS = ["#64748B", COLOR_PRIMARY, COLOR_SECONDARY, COLOR_ACCENT, "#10B981", COLOR_NEGATIVE]
+SANKEY_LINK_COLORS = ["rgba(100, 116, 139, 0.2)", "rgba(15, 118, 110, 0.2)", "rgba(239, 68, 68, 0.1)",
+                      "rgba(14, 165, 233, 0.2)", "rgba(16, 185, 129, 0.2)", "rgba(239, 68, 68, 0.1)"]
+
+# Shared Plotly layout defaults (margins stay per figure)
+DEFAULT_LAYOUT = dict(template="plotly_white")
+
+# Conflict minerals compliance share (%)
+MINERALS_COMPLIANT_PCT = 98
+
+# Per-year KPI values (GHG in tCO2e, energy intensity in kWh/Unit)
+KPI_TABLE = {
+    2025: {"ghg": 49500, "energy": 115},
+    2024: {"ghg": 54000, "energy": 120},
+    2023: {"ghg": 49500, "energy": 115},
+}
+
+
+# Cached Data Simulation (seeded per year so cache hits stay valid)
+def _rng(year, stream):
+    # Independent PCG64 stream per (year, series), so series don't share draws
+    return np.random.default_rng([year, stream])
+
+
+@st.cache_resource
+def _base_trend():
+    # Year-independent baseline, shared read-only across all years and sessions
+    base = np.linspace(6000, 4500, 12)
+    base.setflags(write=False)
+    return base
+
+
+@st.cache_data
+def get_ghg_trend(year):
+    dates = pd.date_range(start=f"{year}-01-01", periods=12, freq='ME')
+    rng = _rng(year, 0)
+    trend_vals = (_base_trend() + rng.normal(0, 100, 12)).astype(np.float32)
+    return dates, trend_vals
+
+
+@st.cache_data
+def get_supplier_scores(year):
+    rng = _rng(year, 1)
+    return rng.normal(72, 10, 200).astype(np.float32)
+
+
+# Cached Figure Builders (figures are shared resources, built once per input)
+@st.cache_resource
+def build_ghg_fig(year):
+    import plotly.graph_objects as go
+    dates, trend_vals = get_ghg_trend(year)
+    fig = go.Figure(go.Scatter(
+        x=dates,
+        y=trend_vals,
+        mode='lines',
+        fill='tozeroy',
+        line=dict(color=COLOR_PRIMARY),
+        fillcolor=RGBA_PRIMARY_10,
+        hovertemplate='Date=%{x}<br>Emissions=%{y}<extra></extra>'
+    ))
+    fig.update_layout(DEFAULT_LAYOUT, title="<b>GHG Emissions Trend</b>", height=380,
+                      margin=dict(t=50, l=20, r=20, b=20), xaxis_title='Date', yaxis_title='Emissions')
+    return fig
+
+
+@st.cache_resource
+def build_energy_fig():
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(
+        x=['Facility A', 'Facility B', 'Facility C'],
+        y=[220, 180, 110],
+        marker_color=COLOR_PRIMARY,
+        hovertemplate='x=%{x}<br>y=%{y}<extra></extra>'
+    ))
+    fig.update_layout(DEFAULT_LAYOUT, title="<b>Energy Consumption by Facility</b>", height=320,
+                      xaxis_title=None, yaxis_title='y')
+    return fig
+
+
+@st.cache_resource
+def build_water_fig():
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(
+        x=['Region X', 'Region Y', 'Region Z'],
+        y=[50, 40, 25],
+        marker_color=COLOR_SECONDARY,
+        hovertemplate='x=%{x}<br>y=%{y}<extra></extra>'
+    ))
+    fig.update_layout(DEFAULT_LAYOUT, title="<b>Water Withdrawal by Region</b>", height=320,
+                      xaxis_title=None, yaxis_title='y')
+    return fig
+
+
+@st.cache_resource
+def build_dist_fig(year):
+    import plotly.graph_objects as go
+    scores = get_supplier_scores(year)
+    fig = go.Figure(go.Box(y=scores, name="", marker_color=COLOR_ACCENT,
+                           hovertemplate='y=%{y}<extra></extra>'))
+    fig.update_layout(DEFAULT_LAYOUT, title="<b>Supplier ESG Score Dist.</b>", height=300, yaxis_title='y',
+                      margin=dict(l=20, r=20))
+    return fig
+
+
+@st.cache_resource
+def build_gauge_fig():
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=85,
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "#111827"},
+            'steps': [{'range': [0, 100], 'color': "#E5E7EB"}]
+        }
+    ))
+    fig.update_layout(DEFAULT_LAYOUT, title="<b>CSRD Readiness</b>", height=300,
+                      margin=dict(l=30, r=30))
+    return fig
+
+
+@st.cache_resource
+def build_incidents_fig():
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=['Q1', 'Q2', 'Q3', 'Q4'], y=[4, 2, 5, 1], name='Count', marker_color=COLOR_NEGATIVE))
+    fig.add_trace(go.Scatter(x=['Q1', 'Q2', 'Q3', 'Q4'], y=[24, 12, 18, 8], name='Hours', yaxis='y2',
+                             line=dict(color='#111827')))
+    fig.update_layout(
+        DEFAULT_LAYOUT,
+        title="<b>Incidents & Response</b>",
+        height=300,
+        showlegend=False,
+        yaxis2=dict(overlaying='y', side='right', showgrid=False)
+    )
+    return fig
+
+
+@st.cache_resource
+def build_sankey():
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[go.Sankey(
+        node=dict(
+            pad=20, thickness=15,
+            line=dict(color="white", width=0),
+            label=["Sourcing", "Manufacturing", "Distribution", "Use Phase", "Recycling", "Landfill"],
+            color=SANKEY_NODE_COLORS
+        ),
+        link=dict(
+            source=[0, 1, 1, 2, 3, 3],
+            target=[1, 2, 5, 3, 4, 5],
+            value=[100, 85, 15, 85, 60, 25],
+            color=SANKEY_LINK_COLORS
+        ))])
+
+    fig.update_layout(
+        DEFAULT_LAYOUT,
+        title_text="<b>Traceability & Impact Flow (Scope 3)</b>",
+        height=500,
+        font_family="Inter"
+    )
+    return fig
+
+
+def get_figures(year, scope):
+    # Per-session memo: only re-resolve the figures when the inputs change
+    key = (year, scope)
+    if st.session_state.get("last_key") != key:
+        st.session_state["figs"] = {
+            "ghg": build_ghg_fig(year),
+            "energy": build_energy_fig(),
+            "water": build_water_fig(),
+            "dist": build_dist_fig(year),
+            "gauge": build_gauge_fig(),
+            "incidents": build_incidents_fig(),
+        }
+        st.session_state["last_key"] = key
+    return st.session_state["figs"]
+
 
 # -----------------------------------------------------------------------------
 # 3. Header & Executive Summary
@@ -94,162 +335,103 @@ st.subheader("Executive Summary")
 k1, k2, k3, k4, k5 = st.columns(5)
 
 # Dynamic Data Simulation
-val_ghg = 54000 if selected_year == 2024 else 49500
-val_energy = 120 if selected_year == 2024 else 115
+kpi = KPI_TABLE[selected_year]
 
-with k1: st.metric("Total GHG Emissions", f"{val_ghg:,} tCO2e", "-8.5%")
-with k2: st.metric("Energy Intensity", f"{val_energy} kWh/Unit", "-4.2%")
+with k1: st.metric("Total GHG Emissions", f"{kpi['ghg']:,} tCO2e", "-8.5%")
+with k2: st.metric("Energy Intensity", f"{kpi['energy']} kWh/Unit", "-4.2%")
 with k3: st.metric("Water Withdrawal", "1.5M m³", "+1.2%", delta_color="inverse")
 with k4: st.metric("ESRS Compliance", "88%", "+12%")
 with k5: st.metric("Supplier ESG Score", "74/100", "+2.5")
 
 st.markdown("##")  # Extra spacing
 
+
 # -----------------------------------------------------------------------------
 # 4. Environmental Performance
 # -----------------------------------------------------------------------------
-st.subheader("Environmental Indicators")
-
-# Layout: 2 Columns (2/3 for Trend, 1/3 for Breakdown)
-col_env1, col_env2 = st.columns([2, 1])
-
-with col_env1:
-    # GHG Emissions Trend
-    dates = pd.date_range(start=f"{selected_year}-01-01", periods=12, freq='M')
-    trend_vals = np.linspace(6000, 4500, 12) + np.random.normal(0, 100, 12)
-    df_trend = pd.DataFrame({'Date': dates, 'Emissions': trend_vals})
-
-    fig_ghg = px.area(df_trend, x='Date', y='Emissions', title="<b>GHG Emissions Trend</b>")
-    fig_ghg.update_traces(line_color=COLOR_PRIMARY, fillcolor="rgba(15, 118, 110, 0.1)")
-    fig_ghg.update_layout(template="plotly_white", height=380, margin=dict(t=50, l=20, r=20, b=20))
-    st.plotly_chart(fig_ghg, use_container_width=True)
-
-with col_env2:
-    # Use tabs to keep it clean and not crowded
-    tab1, tab2 = st.tabs(["Energy Breakdown", "Water Usage"])
-
-    with tab1:
-        # Energy Consumption by Facility
-        fig_energy = px.bar(
-            x=['Facility A', 'Facility B', 'Facility C'],
-            y=[220, 180, 110],
-            title="<b>Energy Consumption by Facility</b>"
-        )
-        fig_energy.update_traces(marker_color=COLOR_PRIMARY)
-        fig_energy.update_layout(template="plotly_white", height=320, xaxis_title=None)
-        st.plotly_chart(fig_energy, use_container_width=True)
-
-    with tab2:
-        # Water Withdrawal by Region
-        fig_water = px.bar(
-            x=['Region X', 'Region Y', 'Region Z'],
-            y=[50, 40, 25],
-            title="<b>Water Withdrawal by Region</b>"
-        )
-        fig_water.update_traces(marker_color=COLOR_SECONDARY)
-        fig_water.update_layout(template="plotly_white", height=320, xaxis_title=None)
-        st.plotly_chart(fig_water, use_container_width=True)
+@st.fragment
+def env_section(figs):
+    st.subheader("Environmental Indicators")
+
+    # Layout: 2 Columns (2/3 for Trend, 1/3 for Breakdown)
+    col_env1, col_env2 = st.columns([2, 1])
+
+    with col_env1:
+        # GHG Emissions Trend
+        st.plotly_chart(figs["ghg"], use_container_width=True)
+
+    with col_env2:
+        # Use tabs to keep it clean and not crowded
+        tab1, tab2 = st.tabs(["Energy Breakdown", "Water Usage"])
+
+        with tab1:
+            # Energy Consumption by Facility
+            st.plotly_chart(figs["energy"], use_container_width=True)
+
+        with tab2:
+            # Water Withdrawal by Region
+            st.plotly_chart(figs["water"], use_container_width=True)
 
-st.markdown("---")
 
 # -----------------------------------------------------------------------------
 # 5. Social & Governance (Side by Side)
 # -----------------------------------------------------------------------------
-c_soc, c_gov = st.columns(2)
-
-with c_soc:
-    st.subheader("Social Responsibility")
-    col_s1, col_s2 = st.columns(2)
-
-    with col_s1:
-        # Supplier ESG Score Distribution
-        scores = np.random.normal(72, 10, 200)
-        fig_dist = px.box(y=scores, title="<b>Supplier ESG Score Dist.</b>")
-        fig_dist.update_traces(marker_color=COLOR_ACCENT)
-        fig_dist.update_layout(template="plotly_white", height=300, margin=dict(l=20, r=20))
-        st.plotly_chart(fig_dist, use_container_width=True)
-
-    with col_s2:
-        # Conflict Minerals
-        fig_minerals = go.Figure(go.Pie(
-            labels=['Compliant', 'Non-Compliant'],
-            values=[98, 2],
-            hole=0.7,
-            marker=dict(colors=[COLOR_PRIMARY, '#EF4444'])
-        ))
-        fig_minerals.update_layout(
-            title="<b>Conflict Minerals (%)</b>",
-            template="plotly_white",
-            height=300,
-            showlegend=False,
-            annotations=[dict(text='98%', x=0.5, y=0.5, font_size=24, showarrow=False, font_color=COLOR_PRIMARY)]
-        )
-        st.plotly_chart(fig_minerals, use_container_width=True)
-
-with c_gov:
-    st.subheader("Governance & Compliance")
-    col_g1, col_g2 = st.columns(2)
-
-    with col_g1:
-        # CSRD Compliance Gauge
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=85,
-            gauge={
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "#111827"},
-                'steps': [{'range': [0, 100], 'color': "#E5E7EB"}]
-            }
-        ))
-        fig_gauge.update_layout(title="<b>CSRD Readiness</b>", template="plotly_white", height=300,
-                                margin=dict(l=30, r=30))
-        st.plotly_chart(fig_gauge, use_container_width=True)
-
-    with col_g2:
-        # Incident Count & Response Time
-        fig_inc = go.Figure()
-        fig_inc.add_trace(go.Bar(x=['Q1', 'Q2', 'Q3', 'Q4'], y=[4, 2, 5, 1], name='Count', marker_color='#EF4444'))
-        fig_inc.add_trace(go.Scatter(x=['Q1', 'Q2', 'Q3', 'Q4'], y=[24, 12, 18, 8], name='Hours', yaxis='y2',
-                                     line=dict(color='#111827')))
-        fig_inc.update_layout(
-            title="<b>Incidents & Response</b>",
-            template="plotly_white",
-            height=300,
-            showlegend=False,
-            yaxis2=dict(overlaying='y', side='right', showgrid=False)
-        )
-        st.plotly_chart(fig_inc, use_container_width=True)
+@st.fragment
+def social_governance_section(figs):
+    c_soc, c_gov = st.columns(2)
+
+    with c_soc:
+        st.subheader("Social Responsibility")
+        col_s1, col_s2 = st.columns(2)
+
+        with col_s1:
+            # Supplier ESG Score Distribution
+            st.plotly_chart(figs["dist"], use_container_width=True)
+
+        with col_s2:
+            # Conflict Minerals
+            st.markdown(
+                '<div class="ring-card"><div class="ring-title">Conflict Minerals (%)</div>'
+                f'<div class="ring" style="--pct:{MINERALS_COMPLIANT_PCT}; --ring-fill:{COLOR_PRIMARY}; '
+                f'--ring-rest:{COLOR_NEGATIVE}">'
+                f'<span>{MINERALS_COMPLIANT_PCT}%<small>Compliant</small></span></div></div>',
+                unsafe_allow_html=True
+            )
+
+    with c_gov:
+        st.subheader("Governance & Compliance")
+        col_g1, col_g2 = st.columns(2)
+
+        with col_g1:
+            # CSRD Compliance Gauge
+            st.plotly_chart(figs["gauge"], use_container_width=True)
+
+        with col_g2:
+            # Incident Count & Response Time
+            st.plotly_chart(figs["incidents"], use_container_width=True)
 
-st.markdown("---")
 
 # -----------------------------------------------------------------------------
 # 6. Value Chain Map
 # -----------------------------------------------------------------------------
-st.subheader("Value Chain Sustainability Map")
+@st.fragment
+def sankey_section():
+    st.subheader("Value Chain Sustainability Map")
+    st.plotly_chart(build_sankey(), use_container_width=True)
 
-# High-end Sankey Colors (Muted/Professional)
-fig_sankey = go.Figure(data=[go.Sankey(
-    node=dict(
-        pad=20, thickness=15,
-        line=dict(color="white", width=0),
-        label=["Sourcing", "Manufacturing", "Distribution", "Use Phase", "Recycling", "Landfill"],
-        color=["#64748B", "#0F766E", "#0EA5E9", "#F59E0B", "#10B981", "#EF4444"]
-    ),
-    link=dict(
-        source=[0, 1, 1, 2, 3, 3],
-        target=[1, 2, 5, 3, 4, 5],
-        value=[100, 85, 15, 85, 60, 25],
-        color=["rgba(100, 116, 139, 0.2)", "rgba(15, 118, 110, 0.2)", "rgba(239, 68, 68, 0.1)",
-               "rgba(14, 165, 233, 0.2)", "rgba(16, 185, 129, 0.2)", "rgba(239, 68, 68, 0.1)"]
-    ))])
-
-fig_sankey.update_layout(
-    title_text="<b>Traceability & Impact Flow (Scope 3)</b>",
-    template="plotly_white",
-    height=500,
-    font_family="Inter"
-)
-st.plotly_chart(fig_sankey, use_container_width=True)
+
+# -----------------------------------------------------------------------------
+# 7. Page Layout
+# -----------------------------------------------------------------------------
+figs = get_figures(selected_year, selected_scope)
+
+env_section(figs)
+st.markdown("---")
+
+social_governance_section(figs)
+st.markdown("---")
+
+sankey_section()
 
 st.markdown("""
 <div style='text-align: center; margin-top: 50px; color: #9CA3AF; font-size: 12px;'>